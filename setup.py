@@ -62,6 +62,7 @@ setup(
     description=f"KSK Management tools",
     classifiers=["Programming Language :: Python :: 3",],
     keywords="",
+    python_requires=">=3.8",
     packages=[
         "kskm.common",
         "kskm.keymaster",
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import replace
-from typing import IO, Dict, Mapping, Optional, Type, cast
+from typing import IO, Dict, Mapping, Optional, Tuple, Type, Union, cast
 
 import voluptuous.error
 import voluptuous.humanize
@@ -17,6 +17,7 @@ from kskm.common.config_misc import (
     ResponsePolicy,
     Schema,
     SchemaAction,
+    SigningKey,
     _parse_keylist,
 )
 from kskm.common.config_schema import KSRSIGNER_CONFIG_SCHEMA
@@ -26,6 +27,12 @@ __author__ = "ft"
 
 logger = logging.getLogger(__name__)
 
+# Use the LibYAML based loader when PyYAML was built with it, since it is much faster
+YAMLSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared value for schema actions without any keys (e.g. no 'revoke')
+_NO_KEYS: Tuple[SigningKey, ...] = ()
+
 
 class ConfigurationError(Exception):
     """Base exception for errors in the configuration."""
@@ -41,12 +48,26 @@ class KSKMConfig:
     def __init__(self, data: Mapping):
         """Initialise configuration from a Mapping."""
         self._data = dict(data)
-        # lazily parsed parts of the configuration.
-        self._hsm: Optional[Mapping] = None
-        self._ksk_keys: Optional[KSKKeysType] = None
-        self._ksk_policy: Optional[KSKPolicy] = None
-        self._request_policy: Optional[RequestPolicy] = None
-        self._response_policy: Optional[ResponsePolicy] = None
+        self._schema_cache: Dict[str, Schema] = {}
+        self._parse_sections()
+
+    def _parse_sections(self) -> None:
+        """Parse all sections of the configuration once, instead of on every access."""
+        self._hsm: Mapping = self._data.get("hsm", {})
+        self._ksk_policy = KSKPolicy.from_dict(self._data.get("ksk_policy", {}))
+        _keys: Dict[str, KSKKey] = {}
+        for name, v in self._data.get("keys", {}).items():
+            _keys[name] = KSKKey.from_dict(v)
+        self._ksk_keys = cast(KSKKeysType, _keys)
+        policy = RequestPolicy.from_dict(self._data.get("request_policy", {}))
+        if policy.dns_ttl == 0:
+            # Replace with the value configured to be used when signing the bundles
+            policy = replace(policy, dns_ttl=self._ksk_policy.ttl)
+        self._request_policy = policy
+        self._response_policy = ResponsePolicy.from_dict(
+            self._data.get("response_policy", {})
+        )
+        self._schema_cache.clear()
 
     @property
     def hsm(self) -> Mapping:
@@ -65,9 +86,6 @@ class KSKMConfig:
                   SOFTHSM2_CONF: /path/to/softhsm.conf
 
         """
-        if self._hsm is None:
-            self._hsm = self._data.get("hsm", {})
-        assert self._hsm is not None  # help type checker
         return self._hsm
 
     @property
@@ -89,9 +107,6 @@ class KSKMConfig:
               ttl: 172800
 
         """
-        if self._ksk_policy is None:
-            self._ksk_policy = KSKPolicy.from_dict(self._data.get("ksk_policy", {}))
-        assert self._ksk_policy is not None  # help type checker
         return self._ksk_policy
 
     @property
@@ -114,15 +129,6 @@ class KSKMConfig:
                 ds_sha256: 49AAC11D7B6F6446702E54A1607371607A1A41855200FD2CE1CDDE32F24E8FB5
 
         """
-        if self._ksk_keys is None:
-            res: Dict[str, KSKKey] = {}
-            if "keys" not in self._data:
-                return cast(KSKKeysType, res)
-            for name, v in self._data["keys"].items():
-                key = KSKKey.from_dict(v)
-                res[name] = key
-            self._ksk_keys = cast(KSKKeysType, res)
-        assert self._ksk_keys is not None  # help type checker
         return self._ksk_keys
 
     def get_filename(self, which: str) -> Optional[str]:
@@ -158,12 +164,6 @@ class KSKMConfig:
               ...
 
         """
-        if self._request_policy is None:
-            policy = RequestPolicy.from_dict(self._data.get("request_policy", {}))
-            if policy.dns_ttl == 0:
-                # Replace with the value configured to be used when signing the bundles
-                policy = replace(policy, dns_ttl=self.ksk_policy.ttl)
-            self._request_policy = policy
         return self._request_policy
 
     @property
@@ -181,11 +181,6 @@ class KSKMConfig:
               validate_signatures: True
 
         """
-        if self._response_policy is None:
-            self._response_policy = ResponsePolicy.from_dict(
-                self._data.get("response_policy", {})
-            )
-        assert self._response_policy is not None  # help type checker
         return self._response_policy
 
     def get_schema(self, name: str) -> Schema:
@@ -213,27 +208,40 @@ class KSKMConfig:
               sign: ksk_next
 
         Note that 'revoke' is optional. Entries may be single key names, or
-        list of key names. In the resulting Schema, it is always a list of key names,
-        even if there is a single key name in the list.
+        list of key names. In the resulting Schema, it is always a tuple of key names,
+        even if there is a single key name in the tuple.
+
+        Parsed schemas are cached, so repeated lookups of the same name are cheap.
 
         :return: A Schema instance for the schema requested.
 
         """
+        cached = self._schema_cache.get(name)
+        if cached is not None:
+            return cached
         data = self._data["schemas"][name]
         _actions: Dict[int, SchemaAction] = {}
         for num in range(1, self.request_policy.num_bundles + 1):
+            _bundle = data[num]
             _this = SchemaAction(
-                publish=_parse_keylist(data[num]["publish"]),
-                sign=_parse_keylist(data[num]["sign"]),
-                revoke=_parse_keylist(data[num].get("revoke", [])),
+                publish=_parse_keylist(_bundle["publish"]),
+                sign=_parse_keylist(_bundle["sign"]),
+                revoke=(
+                    _parse_keylist(_bundle["revoke"])
+                    if "revoke" in _bundle
+                    else _NO_KEYS
+                ),
             )
             _actions[num] = _this
-        return Schema(name=name, actions=_actions)
+        schema = Schema(name=name, actions=_actions)
+        self._schema_cache[name] = schema
+        return schema
 
     def update(self, data: Mapping) -> None:
         """Update configuration on the fly. Usable in tests."""
         logger.warning(f"Updating configuration (sections {data.keys()})")
         self._data.update(data)
+        self._parse_sections()
 
     def merge_update(self, data: Mapping) -> None:
         """Merge-update configuration on the fly. Usable in tests."""
@@ -242,11 +250,12 @@ class KSKMConfig:
             logger.debug(f"Updating config section {k} with {v}")
             self._data[k].update(v)
             logger.debug(f"Config now: {self._data[k]}")
+        self._parse_sections()
 
     @classmethod
-    def from_yaml(cls: Type[KSKMConfig], stream: IO) -> KSKMConfig:
-        """Load configuration from a YAML stream."""
-        config = yaml.safe_load(stream)
+    def from_yaml(cls: Type[KSKMConfig], stream: Union[IO, bytes, str]) -> KSKMConfig:
+        """Load configuration from a YAML stream (or the bytes/string read from one)."""
+        config = yaml.load(stream, Loader=YAMLSafeLoader)
         try:
             voluptuous.humanize.validate_with_humanized_errors(
                 config, KSRSIGNER_CONFIG_SCHEMA
@@ -267,10 +276,10 @@ def get_config(filename: Optional[str]) -> KSKMConfig:
         return KSKMConfig({})
     with open(filename, "rb") as fd:
         config_bytes = fd.read()
-        logger.info(
-            "Loaded configuration from file %s %s",
-            filename,
-            checksum_bytes2str(config_bytes),
-        )
-        fd.seek(0)
-        return KSKMConfig.from_yaml(fd)
+    logger.info(
+        "Loaded configuration from file %s %s",
+        filename,
+        checksum_bytes2str(config_bytes),
+    )
+    # Parse the bytes already read, rather than reading the file again
+    return KSKMConfig.from_yaml(config_bytes)
@@ -2,10 +2,22 @@
 from __future__ import annotations
 
 from abc import ABC
-from copy import deepcopy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, List, Mapping, NewType, Optional, Type, TypeVar, Union
+from functools import cached_property
+from typing import (
+    Any,
+    FrozenSet,
+    List,
+    Mapping,
+    NewType,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from kskm.common.data import AlgorithmDNSSEC, SignaturePolicy
 from kskm.common.parse_utils import duration_to_timedelta, parse_datetime
@@ -16,6 +28,15 @@ __author__ = "ft"
 PolicyType = TypeVar("PolicyType", bound="Policy")
 KSKKeysType = NewType("KSKKeysType", Mapping[str, "KSKKey"])
 
+# Mapping of algorithm names to AlgorithmDNSSEC members, avoiding the overhead of AlgorithmDNSSEC[name]
+_ALGORITHM_BY_NAME = AlgorithmDNSSEC.__members__
+
+# Default RequestPolicy durations. timedelta is immutable, so these can be shared between instances.
+_DEFAULT_MIN_CYCLE_INCEPTION_LENGTH = duration_to_timedelta("P79D")
+_DEFAULT_MAX_CYCLE_INCEPTION_LENGTH = duration_to_timedelta("P81D")
+_DEFAULT_MIN_BUNDLE_INTERVAL = duration_to_timedelta("P9D")
+_DEFAULT_MAX_BUNDLE_INTERVAL = duration_to_timedelta("P11D")
+
 
 @dataclass(frozen=True)
 class Policy(ABC):
@@ -27,7 +48,8 @@ class Policy(ABC):
     @classmethod
     def from_dict(cls: Type[PolicyType], data: dict) -> PolicyType:
         """Instantiate ResponsePolicy from a dict of values."""
-        _data = deepcopy(data)  # don't mess with caller's data
+        # Shallow copy is enough to not mess with caller's data, since only top-level keys are rebound below
+        _data = dict(data)
         # Convert durations provided as strings into datetime.timedelta instances
         for this_td in [
             "min_bundle_interval",
@@ -37,8 +59,45 @@ class Policy(ABC):
         ]:
             if this_td in _data:
                 _data[this_td] = duration_to_timedelta(data[this_td])
+        # Convert algorithms provided by name into AlgorithmDNSSEC, and lists of approved values into frozensets
+        if "approved_algorithms" in _data:
+            _data["approved_algorithms"] = frozenset(
+                _parse_approved_algorithm(x) for x in data["approved_algorithms"]
+            )
+        for this_set in ["rsa_approved_exponents", "rsa_approved_key_sizes"]:
+            if this_set in _data:
+                _data[this_set] = frozenset(data[this_set])
         return cls(**_data)
 
+    @cached_property
+    def sorted_items(self) -> Tuple[Tuple[str, Any], ...]:
+        """
+        All the policy parameters as (name, value) tuples, sorted by name.
+
+        Used for logging the policy. Since the policy is frozen, this is only computed once per instance.
+        """
+        return tuple(
+            (_field.name, _sorted_if_set(getattr(self, _field.name)))
+            for _field in sorted(fields(self), key=lambda x: x.name)
+        )
+
+
+def _sorted_if_set(value: Any) -> Any:
+    """Turn frozensets into sorted lists, so that they are logged in the same order every time."""
+    if not isinstance(value, frozenset):
+        return value
+    if all(isinstance(x, AlgorithmDNSSEC) for x in value):
+        return [x.name for x in sorted(value, key=lambda x: x.value)]
+    return sorted(value)
+
+
+def _parse_approved_algorithm(name: str) -> AlgorithmDNSSEC:
+    """Turn an algorithm name from the approved_algorithms setting into an AlgorithmDNSSEC."""
+    try:
+        return _ALGORITHM_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm in approved_algorithms: {name}")
+
 
 @dataclass(frozen=True)
 class RequestPolicy(Policy):
@@ -54,27 +113,20 @@ class RequestPolicy(Policy):
     rsa_exponent_match_zsk_policy: bool = True
     enable_unsupported_ecdsa: bool = False
     check_cycle_length: bool = True
-    min_cycle_inception_length: timedelta = field(
-        default_factory=lambda: duration_to_timedelta("P79D")
-    )
-    max_cycle_inception_length: timedelta = field(
-        default_factory=lambda: duration_to_timedelta("P81D")
-    )
-    min_bundle_interval: timedelta = field(
-        default_factory=lambda: duration_to_timedelta("P9D")
-    )
-    max_bundle_interval: timedelta = field(
-        default_factory=lambda: duration_to_timedelta("P11D")
-    )
+    min_cycle_inception_length: timedelta = _DEFAULT_MIN_CYCLE_INCEPTION_LENGTH
+    max_cycle_inception_length: timedelta = _DEFAULT_MAX_CYCLE_INCEPTION_LENGTH
+    min_bundle_interval: timedelta = _DEFAULT_MIN_BUNDLE_INTERVAL
+    max_bundle_interval: timedelta = _DEFAULT_MAX_BUNDLE_INTERVAL
 
     # Verify KSR policy parameters
     check_bundle_overlap: bool = True
     signature_algorithms_match_zsk_policy: bool = True
-    approved_algorithms: List[str] = field(
-        default_factory=lambda: [AlgorithmDNSSEC.RSASHA256.name]
+    # Algorithms are given by name in the configuration file, and turned into AlgorithmDNSSEC by from_dict
+    approved_algorithms: FrozenSet[AlgorithmDNSSEC] = frozenset(
+        {AlgorithmDNSSEC.RSASHA256}
     )
-    rsa_approved_exponents: List[int] = field(default_factory=lambda: [65537])
-    rsa_approved_key_sizes: List[int] = field(default_factory=lambda: [2048])
+    rsa_approved_exponents: FrozenSet[int] = frozenset({65537})
+    rsa_approved_key_sizes: FrozenSet[int] = frozenset({2048})
     signature_validity_match_zsk_policy: bool = True
     check_keys_match_ksk_operator_policy: bool = True
     num_keys_per_bundle: List[int] = field(
@@ -93,6 +145,16 @@ class RequestPolicy(Policy):
     check_keys_publish_safety: bool = True
     check_keys_retire_safety: bool = True
 
+    def __post_init__(self) -> None:
+        """Make sure the approved values are frozensets, to make membership checks fast."""
+        # object.__setattr__ has to be used since the dataclass is frozen
+        for this_set in [
+            "approved_algorithms",
+            "rsa_approved_exponents",
+            "rsa_approved_key_sizes",
+        ]:
+            object.__setattr__(self, this_set, frozenset(getattr(self, this_set)))
+
 
 @dataclass(frozen=True)
 class ResponsePolicy(Policy):
@@ -109,9 +171,9 @@ SigningKey = NewType("SigningKey", str)
 class SchemaAction:
     """Actions to take for a specific bundle."""
 
-    publish: Iterable[SigningKey]
-    sign: Iterable[SigningKey]
-    revoke: Iterable[SigningKey]
+    publish: Tuple[SigningKey, ...]
+    sign: Tuple[SigningKey, ...]
+    revoke: Tuple[SigningKey, ...]
 
 
 @dataclass(frozen=True)
@@ -122,10 +184,12 @@ class Schema:
     actions: Mapping[int, SchemaAction]
 
 
-def _parse_keylist(elem: Union[str, List[str]]) -> List[SigningKey]:
-    if isinstance(elem, list):
-        return [SigningKey(x) for x in elem]
-    return [SigningKey(elem)]
+def _parse_keylist(elem: Union[str, List[str]]) -> Tuple[SigningKey, ...]:
+    # SigningKey is a NewType, which does nothing at runtime, so the key names are used as they are.
+    # The YAML loader produces plain lists, so the exact class check is enough (and faster than isinstance).
+    if elem.__class__ is list:
+        return cast(Tuple[SigningKey, ...], tuple(elem))
+    return cast(Tuple[SigningKey, ...], (elem,))
 
 
 @dataclass()
@@ -189,10 +253,10 @@ class KSKKey:
     @classmethod
     def from_dict(cls: Type[KSKKey], data: dict) -> KSKKey:
         """Instantiate KSKKey from a dict of values."""
-        # do not modify callers data
-        _data = deepcopy(data)
+        # do not modify callers data (only top-level keys are rebound below, so a shallow copy is enough)
+        _data = dict(data)
         if "algorithm" in _data:
-            _data["algorithm"] = AlgorithmDNSSEC[_data["algorithm"]]
+            _data["algorithm"] = _ALGORITHM_BY_NAME[_data["algorithm"]]
         for _dt in ["valid_from", "valid_until"]:
             # If the dict is loaded from YAML, these values will already be converted to datetime.
             # If they are not, convert them here.
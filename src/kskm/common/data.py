@@ -1,7 +1,6 @@
 """Data classes common to KSR and SKR Classes."""
 
 from abc import ABC
-from base64 import b64decode
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -143,17 +142,13 @@ class Key:
         """Check for valid DNSKEY flags."""
         # have to import these locally to avoid circular imports  # noqa
         from kskm.common.ecdsa_utils import (
-            ecdsa_public_key_without_prefix,
             expected_ecdsa_key_size,
-            get_ecdsa_pubkey_size,
+            get_dnskey_ecdsa_pubkey_size,
             is_algorithm_ecdsa,
         )
 
         if is_algorithm_ecdsa(self.algorithm):
-            _pubkey = ecdsa_public_key_without_prefix(
-                b64decode(self.public_key), self.algorithm
-            )
-            _size = get_ecdsa_pubkey_size(_pubkey)
+            _size = get_dnskey_ecdsa_pubkey_size(self.public_key, self.algorithm)
             if _size != expected_ecdsa_key_size(self.algorithm):
                 raise ValueError(
                     f"Unexpected ECDSA key length {_size} for algorithm {self.algorithm}"
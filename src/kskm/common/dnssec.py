@@ -2,6 +2,7 @@
 import base64
 import struct
 from dataclasses import replace
+from functools import lru_cache
 
 from kskm.common.data import AlgorithmDNSSEC, Key
 from kskm.common.ecdsa_utils import (
@@ -17,8 +18,15 @@ __author__ = "ft"
 
 def key_to_rdata(key: Key) -> bytes:
     """Return key in DNS RDATA format (RFC 4034)."""
-    header = struct.pack("!HBB", key.flags, key.protocol, key.algorithm.value,)
-    pubkey = base64.b64decode(key.public_key)
+    return _dnskey_rdata(key.flags, key.protocol, key.algorithm.value, key.public_key)
+
+
+def _dnskey_rdata(
+    flags: int, protocol: int, algorithm: int, public_key: bytes
+) -> bytes:
+    """Return the DNSKEY RDATA (RFC 4034) for the given key parts."""
+    header = struct.pack("!HBB", flags, protocol, algorithm,)
+    pubkey = base64.b64decode(public_key)
     return header + pubkey
 
 
@@ -28,7 +36,17 @@ def calculate_key_tag(key: Key) -> int:
 
     The algorithm to do this is found in RFC 4034, Appendix B.
     """
-    rdata = key_to_rdata(key)
+    return _calculate_key_tag(
+        key.flags, key.protocol, key.algorithm.value, key.public_key
+    )
+
+
+@lru_cache(maxsize=512)
+def _calculate_key_tag(
+    flags: int, protocol: int, algorithm: int, public_key: bytes
+) -> int:
+    """Calculate the key tag from the RDATA parts of a key (the key identifier and TTL don't affect it)."""
+    rdata = _dnskey_rdata(flags, protocol, algorithm, public_key)
 
     _odd = False
     _sum = 0
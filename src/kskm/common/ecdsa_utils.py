@@ -2,6 +2,7 @@
 import base64
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 from kskm.common.data import AlgorithmDNSSEC, AlgorithmPolicyECDSA
 from kskm.common.public_key import KSKM_PublicKey
@@ -97,6 +98,13 @@ def ecdsa_public_key_without_prefix(
     return public_key
 
 
+@lru_cache(maxsize=128)
+def get_dnskey_ecdsa_pubkey_size(public_key: bytes, algorithm: AlgorithmDNSSEC) -> int:
+    """Return ECDSA public key size of a base64 encoded DNSKEY public key."""
+    _pubkey = ecdsa_public_key_without_prefix(base64.b64decode(public_key), algorithm)
+    return get_ecdsa_pubkey_size(_pubkey)
+
+
 def get_ecdsa_pubkey_size(public_key: bytes) -> int:
     """Return ECDSA public key size."""
     # pubkey is both x and y points concatenated, so divide by 2
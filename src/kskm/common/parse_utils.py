@@ -2,6 +2,7 @@
 import logging
 import re
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional, Set, Union
 
 from kskm.common.data import (
@@ -84,6 +85,7 @@ def _get_timedelta(policy: dict, name: str) -> timedelta:
     return duration_to_timedelta(policy[name])
 
 
+@lru_cache(maxsize=128)
 def duration_to_timedelta(duration: Optional[str]) -> timedelta:
     """Parse strings such as P14D or PT1H5M (ISO8601 durations) into timedeltas."""
     if not duration:
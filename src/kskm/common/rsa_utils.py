@@ -1,7 +1,6 @@
 """Various functions relating to the RSA algorithm."""
 import base64
 import math
-import struct
 from dataclasses import dataclass, field
 
 from kskm.common.data import AlgorithmDNSSEC, AlgorithmPolicyRSA
@@ -9,14 +8,14 @@ from kskm.common.public_key import KSKM_PublicKey
 
 __author__ = "ft"
 
+_RSA_ALGORITHMS = frozenset(
+    {AlgorithmDNSSEC.RSASHA1, AlgorithmDNSSEC.RSASHA256, AlgorithmDNSSEC.RSASHA512}
+)
+
 
 def is_algorithm_rsa(alg: AlgorithmDNSSEC) -> bool:
     """Check if `alg' is one of the known RSA algorithms."""
-    return alg in [
-        AlgorithmDNSSEC.RSASHA1,
-        AlgorithmDNSSEC.RSASHA256,
-        AlgorithmDNSSEC.RSASHA512,
-    ]
+    return alg in _RSA_ALGORITHMS
 
 
 def parse_signature_policy_rsa(data: dict) -> AlgorithmPolicyRSA:
@@ -28,12 +27,12 @@ def parse_signature_policy_rsa(data: dict) -> AlgorithmPolicyRSA:
     {'attrs': {'algorithm': '8'},
      'value': {'RSA': {'attrs': {'exponent': '3', 'size': '1024'}, 'value': ''}}}
     """
-    attr_alg = AlgorithmDNSSEC(int(data["attrs"]["algorithm"]))
-    attrs = data["value"]["RSA"]["attrs"]
-    rsa = AlgorithmPolicyRSA(
-        bits=int(attrs["size"]), exponent=int(attrs["exponent"]), algorithm=attr_alg,
+    rsa_attrs = data["value"]["RSA"]["attrs"]
+    return AlgorithmPolicyRSA(
+        bits=int(rsa_attrs["size"]),
+        exponent=int(rsa_attrs["exponent"]),
+        algorithm=AlgorithmDNSSEC(int(data["attrs"]["algorithm"])),
     )
-    return rsa
 
 
 @dataclass(frozen=True)
@@ -53,10 +52,10 @@ def decode_rsa_public_key(key: bytes) -> KSKM_PublicKey_RSA:
     _bytes = base64.b64decode(key)
     if _bytes[0] == 0:
         # two bytes length of exponent follows
-        (_exponent_len,) = struct.unpack("!H", _bytes[1:3])
+        _exponent_len = int.from_bytes(_bytes[1:3], byteorder="big")
         _bytes = _bytes[3:]
     else:
-        (_exponent_len,) = struct.unpack("!B", _bytes[0:1])
+        _exponent_len = _bytes[0]
         _bytes = _bytes[1:]
 
     rsa_e = int.from_bytes(_bytes[:_exponent_len], byteorder="big")
@@ -75,7 +74,7 @@ def encode_rsa_public_key(key: KSKM_PublicKey_RSA) -> bytes:
     if _exp_len > 255:
         # A value larger than 255 can't be represented using a single byte. Use long variant
         # of encoding, which is a zero byte followed by the value in two bytes.
-        exp_header = b"\0" + struct.pack("!H", _exp_len)
+        exp_header = b"\0" + _exp_len.to_bytes(2, byteorder="big")
     else:
-        exp_header = struct.pack("!B", _exp_len)
+        exp_header = bytes((_exp_len,))
     return base64.b64encode(exp_header + exp + key.n)
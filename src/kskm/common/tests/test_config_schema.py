@@ -9,7 +9,7 @@ import voluptuous.error
 import voluptuous.humanize
 import yaml
 
-from kskm.common.config import ConfigurationError, get_config
+from kskm.common.config import ConfigurationError, KSKMConfig, get_config
 from kskm.common.config_schema import KSRSIGNER_CONFIG_SCHEMA, WKSR_CONFIG_SCHEMA
 
 CONFIG_DIR = pkg_resources.resource_filename(__name__, "../../../../config")
@@ -86,5 +86,26 @@ class TestConfigSchema(unittest.TestCase):
             )
 
 
+class TestGetSchema(unittest.TestCase):
+    def setUp(self) -> None:
+        with open(os.path.join(CONFIG_DIR, "ksrsigner.yaml")) as input_file:
+            self.config = KSKMConfig(yaml.safe_load(input_file))
+
+    def test_get_schema(self) -> None:
+        """Test parsing a schema from the example config"""
+        schema = self.config.get_schema("normal")
+        self.assertEqual(schema.name, "normal")
+        self.assertEqual(schema.actions[1].publish, ("ksk_current",))
+        self.assertEqual(schema.actions[1].revoke, ())
+
+    def test_get_schema_cached(self) -> None:
+        """Test that repeated lookups of a schema return the cached instance"""
+        schema = self.config.get_schema("normal")
+        self.assertIs(schema, self.config.get_schema("normal"))
+        self.config.update({"schemas": {}})
+        with self.assertRaises(KeyError):
+            self.config.get_schema("normal")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -19,6 +19,13 @@ __author__ = "ft"
 
 _DEBUG_XML_PARSER = False
 
+# Regexp matching the case <KSR id='foo', domain='.'>
+_TAG_WITH_ATTRS_RE = re.compile(r"<(\w+?)(\s+?)(.+?)(/*)>")
+# Regexp matching the case <Request>
+_TAG_RE = re.compile(r"<(\w+)>")
+# Regexp matching one attribute, e.g. id="foo"
+_ATTR_RE = re.compile(r'^(\w+)="(.+?)"\s*(.*)')
+
 
 @dataclass(frozen=False)
 class _XMLElement:
@@ -177,14 +184,12 @@ def _parse_tag(xml: str) -> Tuple[str, Optional[dict], int]:
     :param xml: XML sub-string
     :return: Element name, parsed attributes and index to whatever is after the tag
     """
-    # regexp matching the case <KSR id='foo', domain='.'>
-    m = re.match(r"<(\w+?)(\s+?)(.+?)(/*)>", xml)
+    m = _TAG_WITH_ATTRS_RE.match(xml)
     if m:
         name, ws, attrs, slash = m.groups()
         end_idx = len(name) + len(ws) + len(attrs) + len(slash) + 2
         return name, _parse_attrs(attrs), end_idx
-    # Regexp matching the case <Request>
-    m = re.match(r"<(\w+)>", xml)
+    m = _TAG_RE.match(xml)
     if m:
         name = m.groups()[0]
         end_idx = len(name) + 2
@@ -207,7 +212,7 @@ def _parse_attrs(attrs: str) -> dict:
     res = {}
     while attrs:
         attrs = attrs.strip()
-        m = re.match(r'^(\w+)="(.+?)"\s*(.*)', attrs)
+        m = _ATTR_RE.match(attrs)
         if m:
             name, value, attrs = m.groups()
             res[name] = value
@@ -19,7 +19,7 @@ def key_inventory(p11modules: KSKM_P11, config: KSKMConfig) -> List[str]:
     """Return key inventory."""
     res: List[str] = []
     for module in p11modules:
-        res += [f"HSM {module.label}:"]
+        res.append(f"HSM {module.label}:")
         for slot, session in sorted(module.sessions.items()):
             keys: Dict[KeyClass, Dict[str, KeyInfo]] = dict()
             for this in module.get_key_inventory(session):
@@ -36,8 +36,8 @@ def key_inventory(p11modules: KSKM_P11, config: KSKMConfig) -> List[str]:
             formatted = _format_keys(keys, config)
 
             if formatted:
-                res += [f"  Slot {slot}:"]
-                res += formatted
+                res.append(f"  Slot {slot}:")
+                res.extend(formatted)
     return res
 
 
@@ -83,21 +83,23 @@ def _format_keys(
                     )
 
             if label_and_id in data[KeyClass.PRIVATE]:
-                pairs += [
+                pairs.append(
                     f"      {this.label:7s} {_id_to_str(this.key_id)}{str(this.pubkey)} -- {ksk_info}"
-                ]
+                )
                 del data[KeyClass.PRIVATE][label_and_id]
             del data[KeyClass.PUBLIC][label_and_id]
     if pairs:
-        res += ["    Signing key pairs:"] + pairs
+        res.append("    Signing key pairs:")
+        res.extend(pairs)
 
     # Now, add all leftover keys
     for cls in data.keys():
         _leftovers: List[str] = []
         for this in list(data[cls].values()):
-            _leftovers += [f"      {this.label:7s} {_id_to_str(this.key_id)}"]
+            _leftovers.append(f"      {this.label:7s} {_id_to_str(this.key_id)}")
         if _leftovers:
-            res += [f"    {cls.name} keys:"] + _leftovers
+            res.append(f"    {cls.name} keys:")
+            res.extend(_leftovers)
     return res
 
 
@@ -14,11 +14,11 @@ class Test_Requests(unittest.TestCase):
             num_bundles=1,
             check_cycle_length=False,
             check_keys_match_ksk_operator_policy=False,
-            rsa_approved_exponents=[3, 65537],
-            rsa_approved_key_sizes=[1024],
+            rsa_approved_exponents=frozenset({3, 65537}),
+            rsa_approved_key_sizes=frozenset({1024}),
             signature_validity_match_zsk_policy=False,
             signature_check_expire_horizon=False,
-            approved_algorithms=[AlgorithmDNSSEC.RSASHA256.name],
+            approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256}),
         )
 
     def _make_request(
@@ -136,8 +136,8 @@ class Test_Requests_With_Two_Bundles(Test_Requests):
             num_bundles=2,
             num_keys_per_bundle=[1, 1],
             num_different_keys_in_all_bundles=1,
-            rsa_approved_key_sizes=[2048],
-            approved_algorithms=[AlgorithmDNSSEC.RSASHA256.name],
+            rsa_approved_key_sizes=frozenset({2048}),
+            approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256}),
             validate_signatures=False,  # signatures are tested elsewhere
             signature_horizon_days=-1,  # allow signatures in the past
             min_cycle_inception_length=duration_to_timedelta("P11D"),
@@ -241,7 +241,7 @@ class Test_Validate_KSR_ECDSA(Test_Requests):
         self.policy = replace(
             self.policy,
             enable_unsupported_ecdsa=True,
-            approved_algorithms=[AlgorithmDNSSEC.ECDSAP256SHA256.name],
+            approved_algorithms=frozenset({AlgorithmDNSSEC.ECDSAP256SHA256}),
         )
 
     def _make_signature_algorithm(self) -> str:
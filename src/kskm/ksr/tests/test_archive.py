@@ -42,7 +42,7 @@ class TestParseRealKSRs(unittest.TestCase):
         # Exception: Failed validating KSR request in file icann-ksr-archive/ksr/ksr-root-2010-q3-2.xml:
         #            Key 302c312a302806035504031321566572695369676e20444e5353656320526f6f742054455354205a534b20312d34
         #            in bundle 755af55c-e9fd-4a4d-9335-212647115222 is RSA-1024, but policy dictates [2048]
-        _rsa_approved_key_sizes = [1024, 2048]
+        _rsa_approved_key_sizes = frozenset({1024, 2048})
         # Exception: Failed validating KSR request in file icann-ksr-archive/ksr/ksr-root-2010-q3-2.xml:
         #            Bundle "id=2f50e951 2010-07-11->2010-07-25" overlap 4 days, 23:59:59 with
         #                   "id=755af55c 2010-07-01->2010-07-15" is < claimed minimum 5 days
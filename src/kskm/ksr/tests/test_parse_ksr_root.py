@@ -75,8 +75,8 @@ class TestParseRealKSRs(unittest.TestCase):
         fn = os.path.join(self.data_dir, "ksr-root-2010-q2-0.xml")
         policy = RequestPolicy(
             rsa_exponent_match_zsk_policy=False,
-            rsa_approved_exponents=[3, 65537],
-            rsa_approved_key_sizes=[1024],
+            rsa_approved_exponents=frozenset({3, 65537}),
+            rsa_approved_key_sizes=frozenset({1024}),
             check_bundle_overlap=False,
             signature_validity_match_zsk_policy=False,
             signature_horizon_days=0,
@@ -111,8 +111,8 @@ class TestParseRealKSRs(unittest.TestCase):
         # This policy actually works for this file
         policy = RequestPolicy(
             rsa_exponent_match_zsk_policy=False,
-            rsa_approved_exponents=[3, 65537],
-            rsa_approved_key_sizes=[1024],
+            rsa_approved_exponents=frozenset({3, 65537}),
+            rsa_approved_key_sizes=frozenset({1024}),
             check_bundle_overlap=False,
             signature_validity_match_zsk_policy=False,
         )
@@ -128,7 +128,9 @@ class TestParseRealKSRs(unittest.TestCase):
 
         with self.assertRaises(kskm.ksr.verify_policy.KSR_POLICY_ALG_Violation):
             load_ksr(
-                fn, replace(policy, rsa_approved_key_sizes=[2048]), raise_original=True
+                fn,
+                replace(policy, rsa_approved_key_sizes=frozenset({2048})),
+                raise_original=True,
             )
 
         with self.assertRaises(kskm.ksr.verify_policy.KSR_POLICY_SIG_OVERLAP_Violation):
@@ -150,7 +152,7 @@ class TestParseRealKSRs(unittest.TestCase):
         # Exception: Failed validating KSR request in file ksr-root-2016-q3-0.xml:
         #            Key 3028312630240603550403131d566572695369676e20444e5353656320526f6f74205a534b20312d3237
         #            in bundle df64b6da-c1c7-49df-9958-bef478c095d4 is RSA-1024, but ZSK SignaturePolicy says 2048
-        _rsa_approved_key_sizes = [1024, 2048]
+        _rsa_approved_key_sizes = frozenset({1024, 2048})
         # Exception: Failed validating KSR request in file ksr-root-2016-q3-0.xml:
         #            Bundle "id=836cf0d6 2016-07-11->2016-07-25" overlap 4 days, 23:59:59 with
         #                   "id=df64b6da 2016-07-01->2016-07-15" is < claimed minimum 5 days
@@ -5,6 +5,7 @@ import pkg_resources
 
 from kskm.common.config import get_config
 from kskm.common.config_misc import RequestPolicy
+from kskm.common.data import AlgorithmDNSSEC
 
 
 class TestRequestPolicy(unittest.TestCase):
@@ -24,6 +25,47 @@ class TestRequestPolicy(unittest.TestCase):
         with self.assertRaises(TypeError):
             RequestPolicy.from_dict(data)
 
+    def test_approved_values_frozen(self) -> None:
+        """ Test that approved values are stored as frozensets, with algorithms parsed from names """
+        p = RequestPolicy.from_dict(
+            {
+                "approved_algorithms": ["RSASHA256", "ECDSAP256SHA256"],
+                "rsa_approved_exponents": [3, 65537],
+            }
+        )
+        self.assertEqual(
+            p.approved_algorithms,
+            frozenset({AlgorithmDNSSEC.RSASHA256, AlgorithmDNSSEC.ECDSAP256SHA256}),
+        )
+        self.assertEqual(p.rsa_approved_exponents, frozenset({3, 65537}))
+        self.assertEqual(p.rsa_approved_key_sizes, frozenset({2048}))
+
+    def test_sorted_items(self) -> None:
+        """ Test that approved values are listed in a stable, sorted order """
+        p = RequestPolicy.from_dict(
+            {
+                "approved_algorithms": ["ECDSAP256SHA256", "RSASHA512", "RSASHA256"],
+                "rsa_approved_exponents": [65537, 3],
+            }
+        )
+        items = dict(p.sorted_items)
+        self.assertEqual(
+            items["approved_algorithms"], ["RSASHA256", "RSASHA512", "ECDSAP256SHA256"]
+        )
+        self.assertEqual(items["rsa_approved_exponents"], [3, 65537])
+        self.assertEqual(items["rsa_approved_key_sizes"], [2048])
+        self.assertEqual(
+            [k for k, _ in p.sorted_items], sorted(k for k, _ in p.sorted_items)
+        )
+
+    def test_unknown_approved_algorithm(self) -> None:
+        """ Test that an unknown algorithm name is reported as such """
+        with self.assertRaises(ValueError) as exc:
+            RequestPolicy.from_dict({"approved_algorithms": ["RSASHA257"]})
+        self.assertEqual(
+            "Unknown algorithm in approved_algorithms: RSASHA257", str(exc.exception)
+        )
+
     def test_defaults(self):
         """ Test creating a policy with the default values """
         p = RequestPolicy.from_dict({})
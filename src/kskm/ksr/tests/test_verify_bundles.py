@@ -134,10 +134,9 @@ class Test_Valid_Requests(Test_Requests):
         xml = self._make_request(request_policy=policy)
         policy = replace(
             self.policy,
-            approved_algorithms=[
-                AlgorithmDNSSEC.RSASHA256.name,
-                AlgorithmDNSSEC.ECDSAP256SHA256.name,
-            ],
+            approved_algorithms=frozenset(
+                {AlgorithmDNSSEC.RSASHA256, AlgorithmDNSSEC.ECDSAP256SHA256}
+            ),
             enable_unsupported_ecdsa=True,
         )
         request = request_from_xml(xml)
@@ -149,7 +148,7 @@ class Test_Invalid_Requests(Test_Requests):
         """Test validating a KSR with a key/signature using an unhandled key type"""
         bundle = self._make_request_bundle(algorithm=AlgorithmDNSSEC.ED448.value)
         xml = self._make_request(request_bundle=bundle)
-        policy = RequestPolicy()
+        policy = self.policy
         request = request_from_xml(xml)
         with self.assertRaises(ValueError) as exc:
             validate_request(request, policy)
@@ -163,7 +162,9 @@ class Test_Invalid_Requests(Test_Requests):
         xml = self._make_request(domain="test.", request_bundle="")
         policy = RequestPolicy(
             num_bundles=0,
-            approved_algorithms=["RSASHA256", "DSA"],
+            approved_algorithms=frozenset(
+                {AlgorithmDNSSEC.RSASHA256, AlgorithmDNSSEC.DSA}
+            ),
             num_keys_per_bundle=[],
             num_different_keys_in_all_bundles=0,
         )
@@ -177,7 +178,7 @@ class Test_Invalid_Requests(Test_Requests):
         """Test validating a KSR with two bundles having the same ID."""
         bundle = self._make_request_bundle()
         xml = self._make_request(request_bundle=f"{bundle}\n       {bundle}\n")
-        policy = RequestPolicy()
+        policy = replace(self.policy, num_bundles=2)
         request = request_from_xml(xml)
         with self.assertRaises(KSR_BUNDLE_UNIQUE_Violation) as exc:
             validate_request(request, policy)
@@ -241,6 +242,28 @@ class Test_Invalid_Requests(Test_Requests):
         policy = replace(self.policy, rsa_exponent_match_zsk_policy=False)
         self.assertTrue(validate_request(request, policy))
 
+    def test_wrong_RSA_key_algorithm(self) -> None:
+        """Test a request with an RSA key when the ZSK policy has no RSA algorithm."""
+        signature_algorithm = """
+            <SignatureAlgorithm algorithm="13">
+              <ECDSA size="256"/>
+            </SignatureAlgorithm>
+        """.strip()
+        request_policy = self._make_request_policy(
+            signature_algorithm=signature_algorithm
+        )
+        xml = self._make_request(request_policy=request_policy)
+        request = request_from_xml(xml)
+        with patch("kskm.ksr.verify_bundles.decode_rsa_public_key") as mock_obj:
+            with self.assertRaises(KSR_BUNDLE_KEYS_Violation) as exc:
+                self.assertTrue(validate_request(request, self.policy))
+            # the key should be rejected without being decoded
+            mock_obj.assert_not_called()
+        self.assertEqual(
+            "Key testkey in bundle test-id does not match the ZSK SignaturePolicy",
+            str(exc.exception),
+        )
+
     def test_bad_key_flags(self):
         """Test a request with a non-ZSK key."""
         bundle = self._make_request_bundle(
@@ -255,6 +278,11 @@ class Test_Invalid_Requests(Test_Requests):
             str(exc.exception),
         )
 
+        # the flags are checked even if matching the keys with the ZSK policy is disabled
+        policy = replace(self.policy, keys_match_zsk_policy=False)
+        with self.assertRaises(KSR_BUNDLE_KEYS_Violation):
+            validate_request(request, policy)
+
     def test_wrong_key_tag(self):
         """Test a request with a key with the wrong tag."""
         bundle = self._make_request_bundle(key_tag=12345)
@@ -332,7 +360,7 @@ class Test_Invalid_Requests(Test_Requests):
         )
         xml = self._make_request(request_policy=request_policy, request_bundle=bundle)
         request = request_from_xml(xml)
-        policy = replace(self.policy, rsa_approved_key_sizes=[1024, 2048])
+        policy = replace(self.policy, rsa_approved_key_sizes=frozenset({1024, 2048}))
         with self.assertRaises(KSR_BUNDLE_POP_Violation) as exc:
             validate_request(request, policy)
 
@@ -349,6 +377,32 @@ class Test_ZSK_Policy_Two_Bundles(Test_Requests_With_Two_Bundles):
         request = request_from_xml(xml)
         self.assertTrue(validate_request(request, self.policy))
 
+    def test_key_identifier_reused(self) -> None:
+        """Test two bundles with different keys having the same key identifier"""
+        bundle1, _ = self._get_two_bundles()
+        bundle2 = self._make_request_bundle(
+            bundle_id="test-2",
+            bundle_inception="2019-01-12T00:00:00",
+            bundle_expiration="2019-02-02T00:00:00",
+            key_identifier="RSA1",
+        )
+        xml = self._make_request(bundle1=bundle1, bundle2=bundle2)
+        request = request_from_xml(xml)
+        with self.assertRaises(KSR_BUNDLE_KEYS_Violation) as exc:
+            validate_request(request, self.policy)
+        self.assertEqual(
+            "Key tag RSA1 matches two different keys (the second one in bundle test-2)",
+            str(exc.exception),
+        )
+
+        # this check is skipped together with the ZSK policy matching
+        policy = replace(
+            self.policy,
+            keys_match_zsk_policy=False,
+            check_keys_match_ksk_operator_policy=False,
+        )
+        self.assertTrue(validate_request(request, policy))
+
     def test_min_bundle_cycle_inception(self):
         """ Test two bundles with too small inception interval """
         xml = self._make_request()
@@ -392,7 +446,8 @@ class Test_ECDSA_Bundles(Test_Validate_KSR_ECDSA):
         xml = self._make_request(request_policy=request_policy)
         request = request_from_xml(xml)
         policy = replace(
-            self.policy, approved_algorithms=[AlgorithmDNSSEC.ECDSAP384SHA384.name]
+            self.policy,
+            approved_algorithms=frozenset({AlgorithmDNSSEC.ECDSAP384SHA384}),
         )
         with self.assertRaises(KSR_BUNDLE_KEYS_Violation) as exc:
             self.assertTrue(validate_request(request, policy))
@@ -35,7 +35,7 @@ class Test_Validate_KSR_policy(unittest.TestCase):
         """ Test loading a KSR requesting signatures that has expired already """
         fn = os.path.join(self.data_dir, "ksr-root-2018-q1-0-d_to_e.xml")
         policy = RequestPolicy(
-            signature_horizon_days=180, rsa_approved_exponents=[3, 65537]
+            signature_horizon_days=180, rsa_approved_exponents=frozenset({3, 65537})
         )
         with self.assertRaises(KSR_PolicyViolation):
             load_ksr(fn, policy, raise_original=True)
@@ -44,7 +44,7 @@ class Test_Validate_KSR_policy(unittest.TestCase):
         """ Test loading a KSR requesting signatures that has expired already, but allowing it """
         fn = os.path.join(self.data_dir, "ksr-root-2018-q1-0-d_to_e.xml")
         policy = RequestPolicy(
-            signature_horizon_days=-1, rsa_approved_exponents=[3, 65537]
+            signature_horizon_days=-1, rsa_approved_exponents=frozenset({3, 65537})
         )
         load_ksr(fn, policy, raise_original=True)
 
@@ -53,7 +53,7 @@ class Test_Validate_KSR_policy(unittest.TestCase):
         fn = os.path.join(self.data_dir, "ksr-root-2018-q1-0-d_to_e.xml")
         # first load the KSR, allowing the old signatures
         policy = RequestPolicy(
-            signature_horizon_days=-1, rsa_approved_exponents=[3, 65537]
+            signature_horizon_days=-1, rsa_approved_exponents=frozenset({3, 65537})
         )
         ksr = load_ksr(fn, policy, raise_original=True)
         first_expire = ksr.bundles[0].expiration
@@ -87,7 +87,13 @@ class Test_Invalid_Requests_policy(Test_Requests):
         # DSA is not allowed, even if it is in approved_algorithms
         with self.assertRaises(KSR_POLICY_ALG_Violation) as exc:
             validate_request(
-                request, replace(self.policy, approved_algorithms=["RSASHA256", "DSA"])
+                request,
+                replace(
+                    self.policy,
+                    approved_algorithms=frozenset(
+                        {AlgorithmDNSSEC.RSASHA256, AlgorithmDNSSEC.DSA}
+                    ),
+                ),
             )
         self.assertEqual("Algorithm DSA deprecated", str(exc.exception))
 
@@ -104,7 +110,11 @@ class Test_Invalid_Requests_policy(Test_Requests):
         # RSA is supported, but not RSASHA1
         with self.assertRaises(KSR_POLICY_ALG_Violation) as exc:
             validate_request(
-                request, replace(self.policy, approved_algorithms=["RSASHA256"])
+                request,
+                replace(
+                    self.policy,
+                    approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256}),
+                ),
             )
         self.assertEqual("Algorithm RSASHA1 not supported", str(exc.exception))
 
@@ -121,7 +131,11 @@ class Test_Invalid_Requests_policy(Test_Requests):
         # RSA is supported, but not RSASHA1
         with self.assertRaises(KSR_POLICY_ALG_Violation) as exc:
             validate_request(
-                request, replace(self.policy, approved_algorithms=["RSASHA256"])
+                request,
+                replace(
+                    self.policy,
+                    approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256}),
+                ),
             )
         self.assertEqual(
             "ZSK policy has RSA-1024, but policy dictates [2048]", str(exc.exception)
@@ -140,7 +154,11 @@ class Test_Invalid_Requests_policy(Test_Requests):
         # RSA is supported, but not RSASHA1
         with self.assertRaises(KSR_POLICY_ALG_Violation) as exc:
             validate_request(
-                request, replace(self.policy, approved_algorithms=["RSASHA256"])
+                request,
+                replace(
+                    self.policy,
+                    approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256}),
+                ),
             )
         self.assertEqual(
             "ZSK policy has RSA exponent 17, but policy dictates [65537]",
@@ -159,7 +177,11 @@ class Test_Invalid_Requests_policy(Test_Requests):
         request = request_from_xml(xml)
         with self.assertRaises(KSR_POLICY_ALG_Violation) as exc:
             validate_request(
-                request, replace(self.policy, approved_algorithms=["RSASHA256"])
+                request,
+                replace(
+                    self.policy,
+                    approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256}),
+                ),
             )
         self.assertEqual("Algorithm ECDSA is not supported", str(exc.exception))
 
@@ -170,7 +192,7 @@ class Test_ECDSA_Policy(Test_Validate_KSR_ECDSA):
         xml = self._make_request()
         request = request_from_xml(xml)
         policy = replace(
-            self.policy, approved_algorithms=[AlgorithmDNSSEC.RSASHA256.name]
+            self.policy, approved_algorithms=frozenset({AlgorithmDNSSEC.RSASHA256})
         )
         with self.assertRaises(KSR_POLICY_ALG_Violation) as exc:
             validate_request(request, policy)
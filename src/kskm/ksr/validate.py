@@ -11,7 +11,6 @@ NOTE: Only validation that can be performed with _only the KSR_ are done here.
 """
 
 import logging
-from dataclasses import asdict
 
 from kskm.common.config_misc import RequestPolicy
 from kskm.ksr import Request
@@ -33,9 +32,10 @@ def validate_request(request: Request, policy: RequestPolicy) -> bool:
     on errors. Dealing with return values to determine outcome makes it too easy
     to screw up.
     """
-    logger.info("Validating KSR using request policy:")
-    for k, v in sorted(asdict(policy).items()):
-        logger.info(f"  {k}: {v}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Validating KSR using request policy:")
+        for k, v in policy.sorted_items:
+            logger.info("  %s: %s", k, v)
     verify_header(request, policy, logger)
     verify_bundles(request, policy, logger)
     verify_policy(request, policy, logger)
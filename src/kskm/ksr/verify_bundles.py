@@ -1,12 +1,14 @@
 """Controls to verify KSR bundles."""
-from base64 import b64decode
-from logging import Logger
-from typing import Dict, Optional
+from collections import Counter
+from dataclasses import dataclass
+from logging import DEBUG, Logger
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from cryptography.exceptions import InvalidSignature
 
 from kskm.common.config_misc import RequestPolicy
 from kskm.common.data import (
+    AlgorithmDNSSEC,
     AlgorithmPolicy,
     AlgorithmPolicyECDSA,
     AlgorithmPolicyRSA,
@@ -15,11 +17,7 @@ from kskm.common.data import (
 )
 from kskm.common.display import fmt_timedelta
 from kskm.common.dnssec import calculate_key_tag
-from kskm.common.ecdsa_utils import (
-    ecdsa_public_key_without_prefix,
-    get_ecdsa_pubkey_size,
-    is_algorithm_ecdsa,
-)
+from kskm.common.ecdsa_utils import get_dnskey_ecdsa_pubkey_size, is_algorithm_ecdsa
 from kskm.common.rsa_utils import (
     KSKM_PublicKey_RSA,
     decode_rsa_public_key,
@@ -31,6 +29,12 @@ from kskm.ksr import Request
 
 __author__ = "ft"
 
+# (algorithm, public key, flags, protocol, key tag)
+KeyFingerprint = Tuple[int, bytes, int, int, int]
+
+# The only flags a ZSK in a request is allowed to have
+_ACCEPTABLE_ZSK_FLAGS: int = FlagsDNSKEY.ZONE.value
+
 
 class KSR_BundleViolation(PolicyViolation):
     """Policy violation in a KSRs bundles."""
@@ -60,11 +64,13 @@ def verify_bundles(request: Request, policy: RequestPolicy, logger: Logger) -> N
     """Verify that the bundles in a request conform with the ZSK operators stated policy."""
     logger.debug('Begin "Verify KSR bundles"')
 
+    # The cheap checks go first, to not spend time on key decoding and cryptographic
+    # operations for requests that will be rejected anyway
+    check_bundle_count(request, policy, logger)
     check_unique_ids(request, policy, logger)
+    check_cycle_durations(request, policy, logger)
     check_keys_match_zsk_policy(request, policy, logger)
     check_proof_of_possession(request, policy, logger)
-    check_bundle_count(request, policy, logger)
-    check_cycle_durations(request, policy, logger)
 
     logger.debug('End "Verify KSR bundles"')
 
@@ -83,15 +89,13 @@ def check_unique_ids(request: Request, policy: RequestPolicy, logger: Logger) ->
           SKR is loaded, another pass will be made to validate that no bundle ID from this request was
           present in the last SKR.
     """
-    seen: Dict[str, int] = {}
-    for bundle in request.bundles:
-        if bundle.id in seen:
-            raise KSR_BUNDLE_UNIQUE_Violation(
-                f"More than one bundle with id {bundle.id}"
-            )
-        seen[bundle.id] = 1
-
     _num_bundles = len(request.bundles)
+    if len({bundle.id for bundle in request.bundles}) != _num_bundles:
+        # Only count the occurrences of each id when there actually is a duplicate
+        _counts = Counter(bundle.id for bundle in request.bundles)
+        _dup = next(_id for _id, _count in _counts.items() if _count > 1)
+        raise KSR_BUNDLE_UNIQUE_Violation(f"More than one bundle with id {_dup}")
+
     logger.info(f"KSR-BUNDLE-UNIQUE: All {_num_bundles} bundles have unique ids")
     return
 
@@ -105,137 +109,238 @@ def check_keys_match_zsk_policy(
     KSR-BUNDLE-KEYS:
       Verify that the keys are consistent (key id, tag, public key parameters etc.)
       across all bundles and that the key tags are correctly calculated.
+
+    The basic sanity checks of the keys (flags and key tag) can't be disabled. Disabling
+    keys_match_zsk_policy skips both the checks of the keys against the ZSK policy, and the
+    check that a key identifier refers to the same key in all bundles.
     """
     if not policy.keys_match_zsk_policy:
-        logger.warning("KSR-BUNDLE-KEYS: Disabled by policy (keys_match_zsk_policy)")
-        return
+        logger.warning(
+            "KSR-BUNDLE-KEYS: ZSK policy matching disabled by policy (keys_match_zsk_policy)"
+        )
 
     seen: Dict[str, Key] = {}
+    # The fingerprint and TTL of the keys seen. Together with the key identifier (the dict key),
+    # these are all the parameters of a key, so comparing them is the same as comparing the keys.
+    seen_fp: Dict[str, Tuple[KeyFingerprint, int]] = {}
+    # Fingerprints of the key material already checked, to not have to check the same key
+    # again if it re-appears under another key identifier
+    validated: Set[KeyFingerprint] = set()
+    zsk_policy_index = _index_zsk_policy(request)
 
     for bundle in request.bundles:
+        _bundle_id = bundle.id
         for key in bundle.keys:
-            if key.key_identifier in seen:
+            _key_id = key.key_identifier
+            _fingerprint = _key_fingerprint(key)
+            _seen_fp = seen_fp.get(_key_id)
+            if _seen_fp is not None:
                 # verify the key is identical to previous time it was found
-                if key == seen[key.key_identifier]:
+                if _seen_fp == (_fingerprint, key.ttl):
                     # We've seen and checked this exact key before, no need to do it again
                     continue
-                logger.debug(f"Key as seen before : {seen[key.key_identifier]}")
-                logger.debug(f"Key in bundle {bundle.id}: {key}")
-                raise KSR_BUNDLE_KEYS_Violation(
-                    f"Key tag {key.key_identifier} matches two different keys "
-                    f"(the second one in bundle {bundle.id})"
-                )
-
-            # This is a new key - perform more checks on it
-            if is_algorithm_rsa(key.algorithm):
-                pubkey = decode_rsa_public_key(key.public_key)
-
-                _matching_alg = _find_matching_zsk_policy_rsa_alg(
-                    request, key, pubkey, ignore_exponent=False
-                )
-                if not _matching_alg and not policy.rsa_exponent_match_zsk_policy:
-                    # No match was found. A common error in historic KSRs is to have mismatching exponent
-                    # in ZSK policy and actual key, so if the policy allows it we will search again and
-                    # this time ignore the exponent.
-                    _matching_alg = _find_matching_zsk_policy_rsa_alg(
-                        request, key, pubkey, ignore_exponent=True
-                    )
-                    if _matching_alg:
-                        logger.warning(
-                            f"KSR-BUNDLE-KEYS: Key {key.key_identifier} in bundle {bundle.id} has "
-                            f"exponent {pubkey.exponent}, not matching the ZSK SignaturePolicy"
-                        )
-                if not _matching_alg:
+                if policy.keys_match_zsk_policy:
+                    logger.debug("Key as seen before : %s", seen[_key_id])
+                    logger.debug("Key in bundle %s: %s", _bundle_id, key)
                     raise KSR_BUNDLE_KEYS_Violation(
-                        f"Key {key.key_identifier} in bundle {bundle.id} "
-                        f"does not match the ZSK SignaturePolicy"
-                    )
-                logger.debug(
-                    f"Key {key.key_tag}/{key.key_identifier} parameters accepted"
-                )
-                seen[key.key_identifier] = key
-            elif is_algorithm_ecdsa(key.algorithm):
-                logger.warning(
-                    f"Key {key.key_identifier} in bundle {bundle.id} is an ECDSA key - this is untested"
-                )
-                if not _find_matching_zsk_policy_ecdsa_alg(request, key):
-                    raise KSR_BUNDLE_KEYS_Violation(
-                        f"Key {key.key_identifier} in bundle {bundle.id} "
-                        f"does not match the ZSK SignaturePolicy"
+                        f"Key tag {_key_id} matches two different keys "
+                        f"(the second one in bundle {_bundle_id})"
                     )
+
+            seen[_key_id] = key
+            seen_fp[_key_id] = (_fingerprint, key.ttl)
+
+            if _fingerprint in validated:
                 logger.debug(
-                    f"Key {key.key_tag}/{key.key_identifier} parameters accepted"
-                )
-                seen[key.key_identifier] = key
-            else:
-                raise ValueError(
-                    f"Key {key.key_identifier} in bundle {bundle.id} uses unhandled algorithm: "
-                    f"{key.algorithm}"
+                    "Key %s/%s parameters already accepted", key.key_tag, _key_id
                 )
+                continue
 
-            ACCEPTABLE_ZSK_FLAGS = FlagsDNSKEY.ZONE.value
-            if key.flags != ACCEPTABLE_ZSK_FLAGS:
-                raise KSR_BUNDLE_KEYS_Violation(
-                    f"Key {key.key_identifier} in bundle {bundle.id} "
-                    f"has flags {key.flags}, only {ACCEPTABLE_ZSK_FLAGS} acceptable"
+            # This is a new key - perform more checks on it
+            if policy.keys_match_zsk_policy:
+                _check_key_matches_zsk_policy(
+                    key, _bundle_id, zsk_policy_index, policy, logger
                 )
-            logger.debug(f"Key {key.key_tag}/{key.key_identifier} flags accepted")
+            _check_key_flags_and_tag(key, _bundle_id, logger)
 
-            _key_tag = calculate_key_tag(key)
-            if _key_tag != key.key_tag:
-                raise KSR_BUNDLE_KEYS_Violation(
-                    f"Key {key.key_identifier} in bundle {bundle.id} "
-                    f"has key tag {key.key_tag}, should be {_key_tag}"
-                )
-            logger.debug(f"Key {key.key_tag}/{key.key_identifier} key tag accepted")
+            validated.add(_fingerprint)
 
     _num_keys = len(seen)
-    logger.info(
-        f"KSR-BUNDLE-KEYS: All {_num_keys} unique keys in the bundles accepted by policy"
-    )
+    if policy.keys_match_zsk_policy:
+        logger.info(
+            f"KSR-BUNDLE-KEYS: All {_num_keys} unique keys in the bundles accepted by policy"
+        )
+    else:
+        logger.info(
+            f"KSR-BUNDLE-KEYS: Flags and key tags of all {_num_keys} unique keys in the bundles accepted"
+        )
+
+
+def _key_fingerprint(key: Key) -> KeyFingerprint:
+    """
+    Return the parts of a key that the KSR-BUNDLE-KEYS checks depend on.
+
+    The key identifier and TTL are not included, since they don't affect the outcome of the checks.
+    """
+    return (key.algorithm.value, key.public_key, key.flags, key.protocol, key.key_tag)
+
+
+@dataclass(frozen=True)
+class _ZSKPolicyIndex:
+    """The algorithms of a requests ZSK policy, indexed for fast lookups."""
+
+    # RSA algorithms present at all, to reject keys without having to decode them
+    rsa_algorithms: Set[AlgorithmDNSSEC]
+    # (algorithm, bits, exponent) -> policy
+    rsa: Dict[Tuple[AlgorithmDNSSEC, int, int], AlgorithmPolicyRSA]
+    # (algorithm, bits) -> policy, used when the exponent is to be ignored
+    rsa_any_exponent: Dict[Tuple[AlgorithmDNSSEC, int], AlgorithmPolicyRSA]
+    # (algorithm, bits) -> policy
+    ecdsa: Dict[Tuple[AlgorithmDNSSEC, int], AlgorithmPolicyECDSA]
+
+
+def _index_zsk_policy(request: Request) -> _ZSKPolicyIndex:
+    """Index the algorithms of the ZSK policy once, instead of scanning them for every key."""
+    res = _ZSKPolicyIndex(rsa_algorithms=set(), rsa={}, rsa_any_exponent={}, ecdsa={})
+    for this in request.zsk_policy.algorithms:
+        if isinstance(this, AlgorithmPolicyRSA):
+            res.rsa_algorithms.add(this.algorithm)
+            res.rsa[(this.algorithm, this.bits, this.exponent)] = this
+            res.rsa_any_exponent.setdefault((this.algorithm, this.bits), this)
+        elif isinstance(this, AlgorithmPolicyECDSA):
+            res.ecdsa[(this.algorithm, this.bits)] = this
+    return res
 
 
 def _find_matching_zsk_policy_rsa_alg(
-    request: Request,
+    index: _ZSKPolicyIndex,
     key: Key,
     pubkey: KSKM_PublicKey_RSA,
     ignore_exponent: bool = False,
 ) -> Optional[AlgorithmPolicy]:
-    for this in request.zsk_policy.algorithms:
-        if not isinstance(this, AlgorithmPolicyRSA):
-            # This branch is covered by test cases, but since the order of the set is not guaranteed
-            # it won't register every time
-            continue
-        if (
-            key.algorithm == this.algorithm
-            and pubkey.bits == this.bits
-            and pubkey.exponent == this.exponent
-        ):
-            return this
-        if (
-            key.algorithm == this.algorithm
-            and pubkey.bits == this.bits
-            and ignore_exponent
-        ):
-            return this
-    return None
+    _match = index.rsa.get((key.algorithm, pubkey.bits, pubkey.exponent))
+    if _match is None and ignore_exponent:
+        return index.rsa_any_exponent.get((key.algorithm, pubkey.bits))
+    return _match
 
 
 def _find_matching_zsk_policy_ecdsa_alg(
-    request: Request, key: Key
+    index: _ZSKPolicyIndex, key: Key
 ) -> Optional[AlgorithmPolicy]:
-    for this in request.zsk_policy.algorithms:
-        if not isinstance(this, AlgorithmPolicyECDSA):
-            # This branch is covered by test cases, but since the order of the set is not guaranteed
-            # it won't register every time
-            continue
-        _pubkey = ecdsa_public_key_without_prefix(
-            b64decode(key.public_key), this.algorithm
+    ec_size = get_dnskey_ecdsa_pubkey_size(key.public_key, key.algorithm)
+    return index.ecdsa.get((key.algorithm, ec_size))
+
+
+def _check_key_matches_zsk_policy(
+    key: Key,
+    bundle_id: str,
+    zsk_policy_index: _ZSKPolicyIndex,
+    policy: RequestPolicy,
+    logger: Logger,
+) -> None:
+    """Check that the parameters of a key matches one of the algorithms in the ZSK policy."""
+    _check_alg = _ZSK_POLICY_CHECKS.get(key.algorithm)
+    if _check_alg is None:
+        raise ValueError(
+            f"Key {key.key_identifier} in bundle {bundle_id} uses unhandled algorithm: "
+            f"{key.algorithm}"
+        )
+    _check_alg(key, bundle_id, zsk_policy_index, policy, logger)
+    logger.debug("Key %s/%s parameters accepted", key.key_tag, key.key_identifier)
+
+
+def _check_rsa_key_matches_zsk_policy(
+    key: Key,
+    bundle_id: str,
+    zsk_policy_index: _ZSKPolicyIndex,
+    policy: RequestPolicy,
+    logger: Logger,
+) -> None:
+    if key.algorithm not in zsk_policy_index.rsa_algorithms:
+        # No need to decode the key to know it won't match the policy
+        raise KSR_BUNDLE_KEYS_Violation(
+            f"Key {key.key_identifier} in bundle {bundle_id} "
+            f"does not match the ZSK SignaturePolicy"
+        )
+    pubkey = decode_rsa_public_key(key.public_key)
+
+    _matching_alg = _find_matching_zsk_policy_rsa_alg(
+        zsk_policy_index, key, pubkey, ignore_exponent=False
+    )
+    if not _matching_alg and not policy.rsa_exponent_match_zsk_policy:
+        # No match was found. A common error in historic KSRs is to have mismatching exponent
+        # in ZSK policy and actual key, so if the policy allows it we will search again and
+        # this time ignore the exponent.
+        _matching_alg = _find_matching_zsk_policy_rsa_alg(
+            zsk_policy_index, key, pubkey, ignore_exponent=True
+        )
+        if _matching_alg:
+            logger.warning(
+                "KSR-BUNDLE-KEYS: Key %s in bundle %s has exponent %s, "
+                "not matching the ZSK SignaturePolicy",
+                key.key_identifier,
+                bundle_id,
+                pubkey.exponent,
+            )
+    if not _matching_alg:
+        raise KSR_BUNDLE_KEYS_Violation(
+            f"Key {key.key_identifier} in bundle {bundle_id} "
+            f"does not match the ZSK SignaturePolicy"
         )
-        ec_size = get_ecdsa_pubkey_size(_pubkey)
-        if key.algorithm == this.algorithm and ec_size == this.bits:
-            return this
-    return None
+
+
+def _check_ecdsa_key_matches_zsk_policy(
+    key: Key,
+    bundle_id: str,
+    zsk_policy_index: _ZSKPolicyIndex,
+    policy: RequestPolicy,
+    logger: Logger,
+) -> None:
+    logger.warning(
+        "Key %s in bundle %s is an ECDSA key - this is untested",
+        key.key_identifier,
+        bundle_id,
+    )
+    if not _find_matching_zsk_policy_ecdsa_alg(zsk_policy_index, key):
+        raise KSR_BUNDLE_KEYS_Violation(
+            f"Key {key.key_identifier} in bundle {bundle_id} "
+            f"does not match the ZSK SignaturePolicy"
+        )
+
+
+_ZSKPolicyCheck = Callable[[Key, str, _ZSKPolicyIndex, RequestPolicy, Logger], None]
+
+
+def _build_zsk_policy_checks() -> Dict[AlgorithmDNSSEC, _ZSKPolicyCheck]:
+    """Map the key algorithms to the function to use to check a key against the ZSK policy."""
+    res: Dict[AlgorithmDNSSEC, _ZSKPolicyCheck] = {}
+    for alg in AlgorithmDNSSEC:
+        if is_algorithm_rsa(alg):
+            res[alg] = _check_rsa_key_matches_zsk_policy
+        elif is_algorithm_ecdsa(alg):
+            res[alg] = _check_ecdsa_key_matches_zsk_policy
+    return res
+
+
+_ZSK_POLICY_CHECKS = _build_zsk_policy_checks()
+
+
+def _check_key_flags_and_tag(key: Key, bundle_id: str, logger: Logger) -> None:
+    """Check that a key has the flags of a ZSK, and that the key tag is correct."""
+    if key.flags != _ACCEPTABLE_ZSK_FLAGS:
+        raise KSR_BUNDLE_KEYS_Violation(
+            f"Key {key.key_identifier} in bundle {bundle_id} "
+            f"has flags {key.flags}, only {_ACCEPTABLE_ZSK_FLAGS} acceptable"
+        )
+    logger.debug("Key %s/%s flags accepted", key.key_tag, key.key_identifier)
+
+    _key_tag = calculate_key_tag(key)
+    if _key_tag != key.key_tag:
+        raise KSR_BUNDLE_KEYS_Violation(
+            f"Key {key.key_identifier} in bundle {bundle_id} "
+            f"has key tag {key.key_tag}, should be {_key_tag}"
+        )
+    logger.debug("Key %s/%s key tag accepted", key.key_tag, key.key_identifier)
 
 
 def check_proof_of_possession(
@@ -267,11 +372,9 @@ def check_proof_of_possession(
 
         # All signatures in the bundle have been confirmed to sign all keys in the bundle.
         # Now verify that all keys in the bundle actually was used to create a signature.
+        _signed_by = frozenset(x.key_identifier for x in bundle.signatures)
         for _key in bundle.keys:
-            _sigs = [
-                x for x in bundle.signatures if x.key_identifier == _key.key_identifier
-            ]
-            if not _sigs:
+            if _key.key_identifier not in _signed_by:
                 raise KSR_BUNDLE_POP_Violation(
                     f"Key {_key} was not used to sign the keys in bundle {bundle.id}"
                 )
@@ -320,24 +423,26 @@ def check_cycle_durations(
     cycle_inception_length = (
         request.bundles[-1].inception - request.bundles[0].inception
     )
-    _inc_len_str = fmt_timedelta(cycle_inception_length)
-    _min_inc_str = fmt_timedelta(policy.min_cycle_inception_length)
-    _max_inc_str = fmt_timedelta(policy.max_cycle_inception_length)
-
-    logger.debug(
-        f"Verifying that first bundle inception to last bundle inception ({_inc_len_str}) "
-        f"is between {_min_inc_str} and {_max_inc_str}"
-    )
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "Verifying that first bundle inception to last bundle inception (%s) "
+            "is between %s and %s",
+            fmt_timedelta(cycle_inception_length),
+            fmt_timedelta(policy.min_cycle_inception_length),
+            fmt_timedelta(policy.max_cycle_inception_length),
+        )
 
     if cycle_inception_length < policy.min_cycle_inception_length:
         raise KSR_BUNDLE_CYCLE_DURATION_Violation(
-            f"Cycle inception length ({_inc_len_str}) "
-            f"less than minimum acceptable length {_min_inc_str}"
+            f"Cycle inception length ({fmt_timedelta(cycle_inception_length)}) "
+            f"less than minimum acceptable length "
+            f"{fmt_timedelta(policy.min_cycle_inception_length)}"
         )
     if cycle_inception_length > policy.max_cycle_inception_length:
         raise KSR_BUNDLE_CYCLE_DURATION_Violation(
-            f"Cycle inception length ({_inc_len_str}) "
-            f"greater than maximum acceptable length {_max_inc_str}"
+            f"Cycle inception length ({fmt_timedelta(cycle_inception_length)}) "
+            f"greater than maximum acceptable length "
+            f"{fmt_timedelta(policy.max_cycle_inception_length)}"
         )
 
     logger.info(
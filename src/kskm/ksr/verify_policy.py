@@ -7,7 +7,6 @@ from kskm.common.config_misc import RequestPolicy
 from kskm.common.data import (
     DEPRECATED_ALGORITHMS,
     SUPPORTED_ALGORITHMS,
-    AlgorithmDNSSEC,
     AlgorithmPolicyRSA,
 )
 from kskm.common.display import fmt_bundle, fmt_timedelta, fmt_timestamp
@@ -239,9 +238,11 @@ def check_zsk_policy_algorithm(
         )
         return
 
-    _approved_algorithms = [AlgorithmDNSSEC[x] for x in policy.approved_algorithms]
     for alg in request.zsk_policy.algorithms:
-        if alg.algorithm not in _approved_algorithms:
+        if alg.algorithm not in policy.approved_algorithms:
+            _approved_algorithms = sorted(
+                policy.approved_algorithms, key=lambda x: x.value
+            )
             raise KSR_POLICY_ALG_Violation(
                 f"ZSK policy has {alg.algorithm}, but policy only allows "
                 f"{_approved_algorithms}"
@@ -258,13 +259,13 @@ def check_zsk_policy_algorithm(
             if alg.bits not in policy.rsa_approved_key_sizes:
                 raise KSR_POLICY_ALG_Violation(
                     f"ZSK policy has RSA-{alg.bits}, but policy dictates "
-                    f"{policy.rsa_approved_key_sizes}"
+                    f"{sorted(policy.rsa_approved_key_sizes)}"
                 )
 
             if alg.exponent not in policy.rsa_approved_exponents:
                 raise KSR_POLICY_ALG_Violation(
                     f"ZSK policy has RSA exponent {alg.exponent}, but policy dictates "
-                    f"{policy.rsa_approved_exponents}"
+                    f"{sorted(policy.rsa_approved_exponents)}"
                 )
 
             logger.debug(f"ZSK policy algorithm {alg} parameters accepted")
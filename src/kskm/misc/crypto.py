@@ -1,6 +1,7 @@
 """Code using the Cryptography library."""
 
 import logging
+from functools import lru_cache
 from typing import Optional, Union
 
 from cryptography.exceptions import InvalidSignature
@@ -35,14 +36,23 @@ CryptoPubKey = Union[rsa.RSAPublicKey, ec.EllipticCurvePublicKey]
 
 def key_to_crypto_pubkey(key: Key) -> CryptoPubKey:
     """Turn a Key (DNSKEY) into a CryptoPubKey that can be used with 'cryptography'."""
-    if is_algorithm_rsa(key.algorithm):
-        return pubkey_to_crypto_pubkey(decode_rsa_public_key(key.public_key))
-    if is_algorithm_ecdsa(key.algorithm):
-        crv = algorithm_to_curve(key.algorithm)
-        return pubkey_to_crypto_pubkey(decode_ecdsa_public_key(key.public_key, crv))
+    if is_algorithm_rsa(key.algorithm) or is_algorithm_ecdsa(key.algorithm):
+        return _public_key_to_crypto_pubkey(key.algorithm, key.public_key)
     raise RuntimeError(f"Can't make cryptography public key from {key}")
 
 
+# The same keys are present in many bundles, so decode them only once
+@lru_cache(maxsize=128)
+def _public_key_to_crypto_pubkey(
+    algorithm: AlgorithmDNSSEC, public_key: bytes
+) -> CryptoPubKey:
+    """Load a DNSKEY public key into 'cryptography'."""
+    if is_algorithm_rsa(algorithm):
+        return pubkey_to_crypto_pubkey(decode_rsa_public_key(public_key))
+    crv = algorithm_to_curve(algorithm)
+    return pubkey_to_crypto_pubkey(decode_ecdsa_public_key(public_key, crv))
+
+
 def pubkey_to_crypto_pubkey(pubkey: Optional[KSKM_PublicKey]) -> CryptoPubKey:
     """Turn an KSKM_PublicKey into a CryptoPubKey."""
     if isinstance(pubkey, KSKM_PublicKey_RSA):
@@ -4,7 +4,7 @@ from binascii import hexlify
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Set
+from typing import Collection, Optional
 
 from kskm.common.data import AlgorithmDNSSEC
 
@@ -59,7 +59,7 @@ class TrustAnchor:
     id: str
     source: str
     zone: str
-    keydigests: Set[KeyDigest]
+    keydigests: Collection[KeyDigest]
 
     def to_xml_doc(self) -> str:
         """Export trust anchor as XML document."""
@@ -25,11 +25,12 @@ def create_trustanchor_keydigest(
     """
     rr = _dn2wire(domain)
     rr += key_to_rdata(key)
-    logger.debug(
-        f"Creating DS record for key %s using domain + DNSKEY RDATA\n%s",
-        ksk_key.label,
-        binascii.hexlify(rr),
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Creating DS record for key %s using domain + DNSKEY RDATA\n%s",
+            ksk_key.label,
+            binascii.hexlify(rr),
+        )
     digest = sha256(rr).digest()
     return KeyDigest(
         algorithm=key.algorithm,
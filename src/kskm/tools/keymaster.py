@@ -151,8 +151,8 @@ def inventory(
     """Show HSM inventory."""
     logger.info("Show HSM inventory")
     inv = key_inventory(p11modules, config)
-    inv_str = "\n".join(inv)
-    logger.info(f"Key inventory:\n{inv_str}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Key inventory:\n%s", "\n".join(inv))
 
     return True
 
@@ -10,13 +10,14 @@ import logging.handlers
 import os
 import sys
 from argparse import Namespace as ArgsType
-from typing import Optional
+from typing import Optional, Sequence
 
 import kskm.common
 import kskm.ksr
 import kskm.misc
 import kskm.skr
 from kskm.common.config import ConfigurationError, KSKMConfig, get_config
+from kskm.common.data import BundleType
 from kskm.common.display import format_bundles_for_humans
 from kskm.common.logging import get_logger
 from kskm.common.wordlist import pgp_wordlist
@@ -170,6 +171,17 @@ def _skr_filename(args: ArgsType, config: KSKMConfig) -> Optional[str]:
     return config.get_filename("output_skr")
 
 
+def _log_bundles(
+    logger: logging.Logger, title: str, bundles: Sequence[BundleType]
+) -> None:
+    """Log the bundles in a human readable format, unless INFO level logging is disabled."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(f"{title}:")
+    for line in format_bundles_for_humans(bundles):
+        logger.info(line)
+
+
 def ksrsigner(
     logger: logging.Logger, args: ArgsType, config: Optional[KSKMConfig] = None
 ) -> bool:
@@ -204,9 +216,7 @@ def ksrsigner(
             config.response_policy,
             log_contents=args.log_previous_skr_contents,
         )
-        logger.info("Previous SKR:")
-        for x in format_bundles_for_humans(skr.bundles):
-            logger.info(x)
+        _log_bundles(logger, "Previous SKR", skr.bundles)
 
     #
     # Load the KSR request
@@ -218,9 +228,7 @@ def ksrsigner(
     request = kskm.ksr.load_ksr(
         _ksr_fn, config.request_policy, log_contents=args.log_ksr_contents
     )
-    logger.info("Request:")
-    for x in format_bundles_for_humans(request.bundles):
-        logger.info(x)
+    _log_bundles(logger, "Request", request.bundles)
 
     #
     # Initialise PKCS#11 modules (HSMs)
@@ -268,9 +276,7 @@ def ksrsigner(
     if skr:
         check_last_skr_and_new_skr(skr, new_skr, config.request_policy)
 
-    logger.info("Generated SKR:")
-    for x in format_bundles_for_humans(new_skr.bundles):
-        logger.info(x)
+    _log_bundles(logger, "Generated SKR", new_skr.bundles)
 
     _skr_fn = _skr_filename(args, config)
     output_skr_xml(new_skr, _skr_fn, log_contents=args.log_skr_contents)
@@ -15,7 +15,7 @@ import os
 import sys
 import uuid
 from argparse import Namespace as ArgsType
-from typing import Optional
+from typing import List, Optional
 
 import kskm
 from kskm.common.config import KSKMConfig, get_config
@@ -24,7 +24,7 @@ from kskm.common.dnssec import public_key_to_dnssec_key
 from kskm.common.integrity import checksum_bytes2str
 from kskm.common.logging import get_logger
 from kskm.misc.hsm import get_p11_key
-from kskm.ta import TrustAnchor
+from kskm.ta import KeyDigest, TrustAnchor
 from kskm.ta.keydigest import create_trustanchor_keydigest
 from kskm.version import __verbose_version__
 
@@ -132,7 +132,7 @@ def trustanchor(
     #
     p11modules = kskm.misc.hsm.init_pkcs11_modules_from_dict(config.hsm, name=args.hsm)
 
-    keydigests = set()
+    keydigests: List[KeyDigest] = []
 
     for _name, ksk in config.ksk_keys.items():
         p11key = get_p11_key(ksk.label, p11modules, public=True)
@@ -149,7 +149,7 @@ def trustanchor(
             ttl=config.ksk_policy.ttl,
         )
         this = create_trustanchor_keydigest(ksk, _key)
-        keydigests.add(this)
+        keydigests.append(this)
 
     ta = TrustAnchor(
         id=args.id or str(uuid.uuid4()),
@@ -9,6 +9,7 @@ import voluptuous.humanize
 import yaml
 from werkzeug.serving import run_simple
 
+from kskm.common.config import YAMLSafeLoader
 from kskm.common.config_schema import WKSR_CONFIG_SCHEMA
 from kskm.version import __verbose_version__
 from kskm.wksr.peercert import PeerCertWSGIRequestHandler
@@ -52,7 +53,8 @@ def main() -> None:
     if args.debug:
         logging.basicConfig(level=logging.DEBUG)
 
-    config = yaml.load(open(args.config).read(), Loader=yaml.SafeLoader)
+    with open(args.config) as fp:
+        config = yaml.load(fp, Loader=YAMLSafeLoader)
     try:
         voluptuous.humanize.validate_with_humanized_errors(config, WKSR_CONFIG_SCHEMA)
     except voluptuous.error.Error as exc:
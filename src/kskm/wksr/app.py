@@ -4,11 +4,20 @@ import logging
 
 import yaml
 
+from kskm.common.config import YAMLSafeLoader
+
 from .server import generate_app
 
 DEFAULT_CONFIG = "wksr.yaml"
 
+
+def _load_config(filename: str) -> dict:
+    with open(filename) as fp:
+        res: dict = yaml.load(fp, Loader=YAMLSafeLoader)
+    return res
+
+
 logging.basicConfig(level=logging.INFO)
 
-config = yaml.load(open(DEFAULT_CONFIG).read(), Loader=yaml.SafeLoader)
+config = _load_config(DEFAULT_CONFIG)
 application = generate_app(config)